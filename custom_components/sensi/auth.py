@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from http import HTTPStatus
 from typing import Any, Final
 
@@ -36,7 +36,7 @@ CLIENT_SECRET2: Final = (
 OAUTH_URL2: Final = "https://oauth.sensiapi.io/token"
 
 
-@dataclass
+@dataclass(frozen=True)
 class AuthenticationConfig:
     """Internal Sensi authentication configuration."""
 
@@ -93,9 +93,7 @@ async def _get_new_tokens(hass: HomeAssistant, refresh_token: str) -> any:
     )  # This is used as unique_id in config flow
 
     expires_in = int(response_json.get("expires_in"))
-    result[KEY_EXPIRES_AT] = (
-        datetime.now() + timedelta(seconds=expires_in)
-    ).timestamp()
+    result[KEY_EXPIRES_AT] = datetime.now().timestamp() + expires_in
 
     return result
 
@@ -58,8 +58,21 @@ CAPABILITIES_PARAM = "display_humidity,fan_mode_settings,continuous_backlight,de
 MAX_LOGIN_RETRY: Final = 4
 MAX_DATA_FETCH_COUNT: Final = 5
 
+_UPDATE_INTERVAL: Final = timedelta(seconds=COORDINATOR_UPDATE_INTERVAL)
+_DELAY_REFRESH_AFTER_UPDATE: Final = timedelta(
+    seconds=COORDINATOR_DELAY_REFRESH_AFTER_UPDATE
+)
+
 _SSL_CONTEXT = get_default_context()
 
+# Each capability with the property it is read from and its value getter. This
+# doesn't change, so it is computed once instead of on every capabilities update.
+_CAPABILITIES_LOOKUP: Final = tuple(
+    # key can be property.sub_property
+    (key, key.split(".")[0], CAPABILITIES_VALUE_GETTER.get(key))
+    for key in Capabilities
+)
+
 
 def parse_bool(state: dict[str, Any], key: str) -> bool | None:
     """Parse on/off into bool value."""
@@ -125,10 +138,7 @@ class SensiDevice:
     def update_capabilities(self, data: dict):
         """Update device capabilities."""
 
-        for key in Capabilities:
-            # key can be property.sub_property
-            prop_name = key.split(".")[0]
-            getter = CAPABILITIES_VALUE_GETTER.get(key)
+        for key, prop_name, getter in _CAPABILITIES_LOOKUP:
             if getter:
                 value = getter(data.get(prop_name))
             else:
@@ -565,7 +575,7 @@ class SensiUpdateCoordinator(DataUpdateCoordinator):
             hass,
             LOGGER,
             name="SensiUpdateCoordinator",
-            update_interval=timedelta(seconds=COORDINATOR_UPDATE_INTERVAL),
+            update_interval=_UPDATE_INTERVAL,
         )
 
     def _setup_headers(self, config: AuthenticationConfig):
@@ -623,9 +633,9 @@ class SensiUpdateCoordinator(DataUpdateCoordinator):
         # Testing showed that update after a event request failed to bring new data.
         # The next update would bring in correct data, skipping update conditionally.
         if self._last_event_time_stamp is not None:
-            if (datetime.now() - self._last_event_time_stamp) < timedelta(
-                seconds=COORDINATOR_DELAY_REFRESH_AFTER_UPDATE
-            ):
+            if (
+                datetime.now() - self._last_event_time_stamp
+            ) < _DELAY_REFRESH_AFTER_UPDATE:
                 return self._devices
 
         try:
@@ -691,11 +701,6 @@ class SensiUpdateCoordinator(DataUpdateCoordinator):
     async def async_send_event(self, data: str) -> None:
         """Send a JSON request."""
 
-        await self.async_send_event_priv(data)
-
-    async def async_send_event_priv(self, data: str) -> None:
-        """Send a JSON request."""
-
         self._last_event_time_stamp = None
 
         async with websockets.client.connect(
@@ -16,6 +16,7 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import async_generate_entity_id
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import slugify
 
 from . import SensiDescriptionEntity, get_fan_support, set_fan_support
 from .const import (
@@ -76,6 +77,26 @@ SWITCH_TYPES: Final = (
     ),
 )
 
+FAN_SUPPORT_DESCRIPTION: Final = SwitchEntityDescription(
+    key=CONFIG_FAN_SUPPORT,
+    name="Fan support",
+    icon="mdi:fan-off",
+    entity_category=EntityCategory.CONFIG,
+)
+
+AUX_HEATING_DESCRIPTION: Final = SwitchEntityDescription(
+    key=CONFIG_AUX_HEATING,
+    name="Aux Heating",
+    icon="mdi:heat-pump",
+    entity_category=EntityCategory.CONFIG,
+)
+
+# Slugs of the description keys, these don't change so compute them only once
+_KEY_SLUGS: Final = {
+    description.key: slugify(description.key)
+    for description in (*SWITCH_TYPES, FAN_SUPPORT_DESCRIPTION, AUX_HEATING_DESCRIPTION)
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -88,33 +109,54 @@ async def async_setup_entry(
 
     entities = []
     for device in coordinator.get_devices():
+        prefix = _entity_id_prefix(device)
+
         # A device might not support a setting e.g. Continuous Backlight
         entities.extend(
-            SensiCapabilitySettingSwitch(device, description)
+            SensiCapabilitySettingSwitch(device, description, entity_id_prefix=prefix)
             for description in SWITCH_TYPES
             if device.supports(description.capability)
         )
 
-        entities.append(SensiFanSupportSwitch(device, entry))
-        entities.append(SensiAuxHeatSwitch(device, entry))
+        entities.append(SensiFanSupportSwitch(device, entry, entity_id_prefix=prefix))
+        entities.append(SensiAuxHeatSwitch(device, entry, entity_id_prefix=prefix))
 
     async_add_entities(entities)
 
 
+def _entity_id_prefix(device: SensiDevice) -> str:
+    """Return the object_id prefix shared by all switches of a device."""
+    return slugify(f"{SENSI_DOMAIN}_{device.name}") + "_"
+
+
+def _generate_entity_id(device: SensiDevice, key: str, prefix: str | None) -> str:
+    """Generate the entity_id for a switch.
+
+    The entity_id is assembled from the slugs directly, async_generate_entity_id
+    is only used if it is already taken.
+    """
+    hass = device.coordinator.hass
+    object_id = (prefix or _entity_id_prefix(device)) + _KEY_SLUGS[key]
+    entity_id = ENTITY_ID_FORMAT.format(object_id)
+    if hass.states.async_available(entity_id):
+        return entity_id
+
+    return async_generate_entity_id(ENTITY_ID_FORMAT, object_id, hass=hass)
+
+
 class SensiCapabilitySettingSwitch(SensiDescriptionEntity, SwitchEntity):
     """Representation of a Sensi thermostat capability setting."""
 
     def __init__(
-        self, device: SensiDevice, description: SwitchEntityDescription
+        self,
+        device: SensiDevice,
+        description: SwitchEntityDescription,
+        entity_id_prefix: str | None = None,
     ) -> None:
         """Initialize the setting."""
         super().__init__(device, description)
 
-        self.entity_id = async_generate_entity_id(
-            ENTITY_ID_FORMAT,
-            f"{SENSI_DOMAIN}_{device.name}_{description.key}",
-            hass=device.coordinator.hass,
-        )
+        self.entity_id = _generate_entity_id(device, description.key, entity_id_prefix)
 
     @property
     def is_on(self) -> bool | None:
@@ -123,38 +165,37 @@ class SensiCapabilitySettingSwitch(SensiDescriptionEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
-        await self._device.async_set_setting(self.entity_description.key, True)
-        self.async_write_ha_state()
+        await self._async_set(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
-        await self._device.async_set_setting(self.entity_description.key, False)
+        await self._async_set(False)
+
+    async def _async_set(self, value: bool) -> None:
+        """Update the setting."""
+        await self._device.async_set_setting(self.entity_description.key, value)
         self.async_write_ha_state()
 
 
 class SensiFanSupportSwitch(SensiDescriptionEntity, SwitchEntity):
     """Representation of Sensi thermostat fan support setting."""
 
-    def __init__(self, device: SensiDevice, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        device: SensiDevice,
+        entry: ConfigEntry,
+        entity_id_prefix: str | None = None,
+    ) -> None:
         """Initialize the setting."""
 
-        description = SwitchEntityDescription(
-            key=CONFIG_FAN_SUPPORT,
-            name="Fan support",
-            icon="mdi:fan-off",
-            entity_category=EntityCategory.CONFIG,
-        )
-
-        super().__init__(device, description)
+        super().__init__(device, FAN_SUPPORT_DESCRIPTION)
 
         # Cache status to avoid querying ConfigEntry
         self._status: bool | None = None
 
         self._entry = entry
-        self.entity_id = async_generate_entity_id(
-            ENTITY_ID_FORMAT,
-            f"{SENSI_DOMAIN}_{device.name}_{description.key}",
-            hass=device.coordinator.hass,
+        self.entity_id = _generate_entity_id(
+            device, FAN_SUPPORT_DESCRIPTION.key, entity_id_prefix
         )
 
     @property
@@ -166,17 +207,16 @@ class SensiFanSupportSwitch(SensiDescriptionEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
-        set_fan_support(self.hass, self._device, self._entry, True)
-        self._status = True
-        self.async_write_ha_state()
-
-        # Force coordinator refresh to get climate entity to use new fan status
-        await self._device.coordinator.async_request_refresh()
+        await self._async_set(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
-        set_fan_support(self.hass, self._device, self._entry, False)
-        self._status = False
+        await self._async_set(False)
+
+    async def _async_set(self, value: bool) -> None:
+        """Update the fan support status."""
+        set_fan_support(self.hass, self._device, self._entry, value)
+        self._status = value
         self.async_write_ha_state()
 
         # Force coordinator refresh to get climate entity to use new fan status
@@ -188,23 +228,19 @@ class SensiAuxHeatSwitch(SensiDescriptionEntity, SwitchEntity):
 
     _last_hvac_mode_before_aux_heat: HVACMode | str | None
 
-    def __init__(self, device: SensiDevice, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        device: SensiDevice,
+        entry: ConfigEntry,
+        entity_id_prefix: str | None = None,
+    ) -> None:
         """Initialize the setting."""
 
-        description = SwitchEntityDescription(
-            key=CONFIG_AUX_HEATING,
-            name="Aux Heating",
-            icon="mdi:heat-pump",
-            entity_category=EntityCategory.CONFIG,
-        )
-
-        super().__init__(device, description)
+        super().__init__(device, AUX_HEATING_DESCRIPTION)
 
         self._entry = entry
-        self.entity_id = async_generate_entity_id(
-            ENTITY_ID_FORMAT,
-            f"{SENSI_DOMAIN}_{device.name}_{description.key}",
-            hass=device.coordinator.hass,
+        self.entity_id = _generate_entity_id(
+            device, AUX_HEATING_DESCRIPTION.key, entity_id_prefix
         )
 
         self._last_hvac_mode_before_aux_heat = device.hvac_mode
@@ -226,10 +262,11 @@ class SensiAuxHeatSwitch(SensiDescriptionEntity, SwitchEntity):
 
         self._last_hvac_mode_before_aux_heat = self._device.hvac_mode
 
+        # Update all device entities, the climate entity reflects the new hvac_mode
         if await self._device.async_enable_aux_mode():
-            self.async_schedule_update_ha_state(True)
+            self._device.coordinator.async_update_listeners()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn aux heating off."""
         if await self._device.async_set_hvac_mode(self._last_hvac_mode_before_aux_heat):
-            self.async_schedule_update_ha_state(True)
+            self._device.coordinator.async_update_listeners()
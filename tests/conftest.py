@@ -1,12 +1,9 @@
 import json
 import os
+from types import MappingProxyType
 
 import pytest
 
-from custom_components.sensi.auth import AuthenticationConfig
-from custom_components.sensi.coordinator import SensiUpdateCoordinator
-from homeassistant.core import HomeAssistant
-
 
 def load_json(filename):
     """Load sample JSON."""
@@ -15,17 +12,10 @@ def load_json(filename):
         return fptr.read()
 
 
-@pytest.fixture(name="mock_coordinator")
-def create_mock_crumb_coordinator(hass: HomeAssistant) -> SensiUpdateCoordinator:
-    """Fixture to provide a test instance of CrumbCoordinator."""
-    config = AuthenticationConfig()
-    config.access_token = "access_token"
-    config.expires_at = 12345
-    config.refresh_token = "refresh_token"
-    return SensiUpdateCoordinator(hass, config)
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_json():
-    """Return sample JSON data."""
-    return json.loads(load_json("sample.json"))
+    """Return sample JSON data.
+
+    The data is loaded once and shared by all tests, so it is read-only.
+    """
+    return json.loads(load_json("sample.json"), object_hook=MappingProxyType)
@@ -4,7 +4,8 @@ from custom_components.sensi.const import SENSI_FAN_ON
 from custom_components.sensi.coordinator import SensiDevice
 
 
-def test_update(mock_coordinator, mock_json) -> None:
+def test_update(mock_json) -> None:
     """Test update of SensiDevice."""
-    device = SensiDevice(mock_coordinator, mock_json)
+    # Parsing doesn't use the coordinator, so there is no need to set up hass
+    device = SensiDevice(None, mock_json)
     assert device.fan_mode == SENSI_FAN_ON
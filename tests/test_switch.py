@@ -0,0 +1,43 @@
+"""Tests for Sensi switches."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.sensi.const import CONFIG_FAN_SUPPORT
+from custom_components.sensi.coordinator import SensiDevice
+from custom_components.sensi.switch import _generate_entity_id
+
+
+def create_device(mock_json, name: str) -> SensiDevice:
+    """Create a SensiDevice with the given name and no existing entities."""
+    data = {**mock_json, "registration": {**mock_json["registration"], "name": name}}
+    coordinator = MagicMock()
+    coordinator.hass.states.async_available.return_value = True
+    return SensiDevice(coordinator, data)
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Living Room", "switch.sensi_living_room_fan_support"),
+        ("", "switch.sensi_fan_support"),
+        ("\U0001f525", "switch.sensi_fan_support"),
+    ],
+)
+def test_generate_entity_id(mock_json, name: str, expected: str) -> None:
+    """Test entity_id generation for a switch."""
+    device = create_device(mock_json, name)
+    assert _generate_entity_id(device, CONFIG_FAN_SUPPORT, None) == expected
+
+
+def test_generate_entity_id_taken(mock_json) -> None:
+    """Test entity_id generation when the preferred entity_id is taken."""
+    device = create_device(mock_json, "Living Room")
+    device.coordinator.hass.states.async_available.side_effect = lambda entity_id: (
+        entity_id != "switch.sensi_living_room_fan_support"
+    )
+    assert (
+        _generate_entity_id(device, CONFIG_FAN_SUPPORT, None)
+        == "switch.sensi_living_room_fan_support_2"
+    )